@@ -2,13 +2,14 @@
 """Retrain ML model on new LLM-generated email data."""
 
 from snowflake.snowpark import Session
+from snowflake.snowpark.functions import col, lit, when
 from snowflake.ml.modeling.xgboost import XGBClassifier
 from snowflake.ml.registry import Registry
 
 session = Session.builder.getOrCreate()
 session.sql("USE WAREHOUSE COMPLIANCE_DEMO_WH").collect()
-session.sql("USE DATABASE COMPLIANCE_DEMO").collect()
-session.sql("USE SCHEMA ML").collect()
+# A qualified USE SCHEMA sets the database too, saving a round trip
+session.sql("USE SCHEMA COMPLIANCE_DEMO.ML").collect()
 
 print("Training XGBoost model on new data...")
 
@@ -26,8 +27,12 @@ features_df = session.table("EMAIL_SEMANTIC_FEATURES")
 
 train_df, test_df = features_df.random_split([0.8, 0.2], seed=42)
 
-print(f"Training samples: {train_df.count()}")
-print(f"Test samples: {test_df.count()}")
+# Both split counts are submitted before waiting on either, so they run concurrently
+train_count_job = train_df.count(block=False)
+test_count_job = test_df.count(block=False)
+
+print(f"Training samples: {train_count_job.result()}")
+print(f"Test samples: {test_count_job.result()}")
 
 model = XGBClassifier(
     input_cols=FEATURE_COLS,
@@ -42,22 +47,23 @@ model.fit(train_df)
 print("Model trained!")
 
 predictions = model.predict_proba(test_df)
-predictions.write.mode("overwrite").save_as_table("MODEL_TEST_PREDICTIONS")
+predictions.write.mode("overwrite").save_as_table("MODEL_TEST_PREDICTIONS", table_type="temporary")
 
 results = session.sql("""
     SELECT 
-        COUNT(*) as total,
-        SUM(CASE WHEN PREDICT_PROBA_1 >= 0.5 AND IS_VIOLATION = 1 THEN 1 ELSE 0 END) as tp,
-        SUM(CASE WHEN PREDICT_PROBA_1 >= 0.5 AND IS_VIOLATION = 0 THEN 1 ELSE 0 END) as fp,
-        SUM(CASE WHEN PREDICT_PROBA_1 < 0.5 AND IS_VIOLATION = 1 THEN 1 ELSE 0 END) as fn,
-        SUM(CASE WHEN PREDICT_PROBA_1 < 0.5 AND IS_VIOLATION = 0 THEN 1 ELSE 0 END) as tn
-    FROM MODEL_TEST_PREDICTIONS
+        DIV0(tp, tp + fp) as precision,
+        DIV0(tp, tp + fn) as recall,
+        DIV0(2 * tp, 2 * tp + fp + fn) as f1
+    FROM (
+        SELECT 
+            COUNT_IF(PREDICT_PROBA_1 >= 0.5 AND IS_VIOLATION = 1) as tp,
+            COUNT_IF(PREDICT_PROBA_1 >= 0.5 AND IS_VIOLATION = 0) as fp,
+            COUNT_IF(PREDICT_PROBA_1 < 0.5 AND IS_VIOLATION = 1) as fn
+        FROM MODEL_TEST_PREDICTIONS
+    )
 """).collect()[0]
 
-tp, fp, fn, tn = results["TP"], results["FP"], results["FN"], results["TN"]
-precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+precision, recall, f1 = results["PRECISION"], results["RECALL"], results["F1"]
 
 print(f"Test metrics: Precision={precision:.2%}, Recall={recall:.2%}, F1={f1:.2%}")
 
@@ -73,21 +79,17 @@ print("Model registered as EMAIL_COMPLIANCE_CLASSIFIER v3_llm_data")
 
 print("Generating full predictions with three-way classification...")
 
-all_predictions = model.predict_proba(features_df)
-all_predictions.write.mode("overwrite").save_as_table("MODEL_PREDICTIONS_RAW")
-
-session.sql("""
-    CREATE OR REPLACE TABLE MODEL_PREDICTIONS_V1 AS
-    SELECT 
-        *,
-        PREDICT_PROBA_1 as VIOLATION_PROBABILITY,
-        CASE 
-            WHEN PREDICT_PROBA_1 >= 0.7 THEN 'HIGH_RISK'
-            WHEN PREDICT_PROBA_1 <= 0.3 THEN 'LOW_RISK'
-            ELSE 'NEEDS_REVIEW'
-        END as ML_DECISION
-    FROM MODEL_PREDICTIONS_RAW
-""").collect()
+# Decision columns are added in the same plan as scoring, so predictions are written once
+all_predictions = model.predict_proba(features_df).with_columns(
+    ["VIOLATION_PROBABILITY", "ML_DECISION"],
+    [
+        col("PREDICT_PROBA_1"),
+        when(col("PREDICT_PROBA_1") >= 0.7, lit("HIGH_RISK"))
+        .when(col("PREDICT_PROBA_1") <= 0.3, lit("LOW_RISK"))
+        .otherwise(lit("NEEDS_REVIEW")),
+    ],
+)
+all_predictions.write.mode("overwrite").save_as_table("MODEL_PREDICTIONS_V1")
 
 dist = session.sql("""
     SELECT 
@@ -97,49 +97,49 @@ def create_database_and_schemas(session: Session) -> None:
 
 
 def create_tables(session: Session) -> None:
-    """Create the required tables."""
+    """Create the required tables in a single anonymous block (one round-trip)."""
     print(f"\nCreating tables...")
     
-    # Main emails table
     session.sql(f"""
-        CREATE OR REPLACE TABLE {DATABASE_NAME}.{SCHEMA_EMAIL}.EMAILS (
-            EMAIL_ID        VARCHAR(36) PRIMARY KEY,
-            SENDER          VARCHAR(100) NOT NULL,
-            RECIPIENT       VARCHAR(100) NOT NULL,
-            CC              VARCHAR(500),
-            SUBJECT         VARCHAR(500),
-            BODY            VARCHAR(16777216),
-            SENT_AT         TIMESTAMP_NTZ NOT NULL,
-            SENDER_DEPT     VARCHAR(50),
-            RECIPIENT_DEPT  VARCHAR(50),
-            COMPLIANCE_LABEL VARCHAR(50),
-            LOADED_AT       TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-        )
+        EXECUTE IMMEDIATE $$
+        BEGIN
+            -- Main emails table
+            CREATE OR REPLACE TABLE {DATABASE_NAME}.{SCHEMA_EMAIL}.EMAILS (
+                EMAIL_ID        VARCHAR(36) PRIMARY KEY,
+                SENDER          VARCHAR(100) NOT NULL,
+                RECIPIENT       VARCHAR(100) NOT NULL,
+                CC              VARCHAR(500),
+                SUBJECT         VARCHAR(500),
+                BODY            VARCHAR(16777216),
+                SENT_AT         TIMESTAMP_NTZ NOT NULL,
+                SENDER_DEPT     VARCHAR(50),
+                RECIPIENT_DEPT  VARCHAR(50),
+                COMPLIANCE_LABEL VARCHAR(50),
+                LOADED_AT       TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
+            );
+            
+            -- Fine-tuning training data table
+            CREATE OR REPLACE TABLE {DATABASE_NAME}.{SCHEMA_ML}.FINETUNE_TRAINING (
+                SAMPLE_ID       NUMBER AUTOINCREMENT,
+                PROMPT          VARCHAR(16777216),
+                COMPLETION      VARCHAR(16777216),
+                LOADED_AT       TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
+            );
+            
+            -- Embeddings table (for vector search)
+            CREATE OR REPLACE TABLE {DATABASE_NAME}.{SCHEMA_SEARCH}.EMAIL_EMBEDDINGS (
+                EMAIL_ID        VARCHAR(36) PRIMARY KEY,
+                SUBJECT         VARCHAR(500),
+                BODY_PREVIEW    VARCHAR(1000),
+                COMPLIANCE_LABEL VARCHAR(50),
+                EMBEDDING       VECTOR(FLOAT, 768),
+                EMBEDDED_AT     TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
+            );
+        END;
+        $$
     """).collect()
     print(f"  ✓ Table {SCHEMA_EMAIL}.EMAILS created")
-    
-    # Fine-tuning training data table
-    session.sql(f"""
-        CREATE OR REPLACE TABLE {DATABASE_NAME}.{SCHEMA_ML}.FINETUNE_TRAINING (
-            SAMPLE_ID       NUMBER AUTOINCREMENT,
-            PROMPT          VARCHAR(16777216),
-            COMPLETION      VARCHAR(16777216),
-            LOADED_AT       TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-        )
-    """).collect()
     print(f"  ✓ Table {SCHEMA_ML}.FINETUNE_TRAINING created")
-    
-    # Embeddings table (for vector search)
-    session.sql(f"""
-        CREATE OR REPLACE TABLE {DATABASE_NAME}.{SCHEMA_SEARCH}.EMAIL_EMBEDDINGS (
-            EMAIL_ID        VARCHAR(36) PRIMARY KEY,
-            SUBJECT         VARCHAR(500),
-            BODY_PREVIEW    VARCHAR(1000),
-            COMPLIANCE_LABEL VARCHAR(50),
-            EMBEDDING       VECTOR(FLOAT, 768),
-            EMBEDDED_AT     TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-        )
-    """).collect()
     print(f"  ✓ Table {SCHEMA_SEARCH}.EMAIL_EMBEDDINGS created")
 
 
@@ -191,6 +191,11 @@ def upload_files(session: Session) -> None:
     print(f"  ✓ Uploaded {FINETUNE_FILE.name}")
 
 
+def rows_loaded(copy_results: list) -> int:
+    """Sum rows_loaded from a COPY INTO result (files already loaded report no rows)."""
+    return sum(row.as_dict().get("rows_loaded", 0) for row in copy_results)
+
+
 def load_emails(session: Session) -> None:
     """Load email data from stage into table."""
     print(f"\nLoading emails into table...")
@@ -206,8 +211,8 @@ def load_emails(session: Session) -> None:
             ESCAPE_UNENCLOSED_FIELD = NONE
     """).collect()
     
-    # Load data
-    session.sql(f"""
+    # Load data (COPY reports rows loaded per file, so no follow-up COUNT(*) is needed)
+    copy_results = session.sql(f"""
         COPY INTO {DATABASE_NAME}.{SCHEMA_EMAIL}.EMAILS (
             EMAIL_ID, SENDER, RECIPIENT, CC, SUBJECT, BODY, 
             SENT_AT, SENDER_DEPT, RECIPIENT_DEPT, COMPLIANCE_LABEL
@@ -217,10 +222,7 @@ def load_emails(session: Session) -> None:
         ON_ERROR = 'CONTINUE'
     """).collect()
     
-    # Verify count
-    count = session.sql(f"""
-        SELECT COUNT(*) as cnt FROM {DATABASE_NAME}.{SCHEMA_EMAIL}.EMAILS
-    """).collect()[0]["CNT"]
+    count = rows_loaded(copy_results)
     print(f"  ✓ Loaded {count:,} emails")
 
 
@@ -236,7 +238,7 @@ def load_finetune_data(session: Session) -> None:
     """).collect()
     
     # Load data (JSONL needs special handling)
-    session.sql(f"""
+    copy_results = session.sql(f"""
         COPY INTO {DATABASE_NAME}.{SCHEMA_ML}.FINETUNE_TRAINING (PROMPT, COMPLETION)
         FROM (
             SELECT 
@@ -248,10 +250,7 @@ def load_finetune_data(session: Session) -> None:
         ON_ERROR = 'CONTINUE'
     """).collect()
     
-    # Verify count
-    count = session.sql(f"""
-        SELECT COUNT(*) as cnt FROM {DATABASE_NAME}.{SCHEMA_ML}.FINETUNE_TRAINING
-    """).collect()[0]["CNT"]
+    count = rows_loaded(copy_results)
     print(f"  ✓ Loaded {count} fine-tuning samples")
 
 